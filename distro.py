@@ -16,15 +16,29 @@ import os
 import re
 import sys
 import json
-import shlex
 import logging
 import argparse
+import functools
 import subprocess
-
+from functools import cached_property
 
 _UNIXCONFDIR = os.environ.get('UNIXCONFDIR', '/etc')
+_UNIXUSRLIBDIR = os.environ.get('UNIXUSRLIBDIR', '/usr/lib')
 _OS_RELEASE_BASENAME = 'os-release'
 
+# Parsed results are cached here across processes, along with the mtimes of
+# the files they were derived from; see LinuxDistribution._from_disk_cache().
+_CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'distro.json')
+
+# Attributes that are set while computing a cached value, and need to be
+# stored and restored along with it.
+_DISK_CACHE_ATTRS = {
+    'os_release_info': 'os_release_file',
+    'distro_release_info': 'distro_release_file',
+}
+
 #: Translation table for normalizing the "ID" attribute defined in os-release
 #: files, for use by the :func:`distro.id` method.
 #:
@@ -60,37 +74,221 @@ NORMALIZED_DISTRO_ID = {
     'redhat': 'rhel',  # RHEL 6.x, 7.x
 }
 
-# Pattern for content of distro release file (reversed)
-_DISTRO_RELEASE_CONTENT_REVERSED_PATTERN = re.compile(
-    r'(?:[^)]*\)(.*)\()? *(?:STL )?([\d.+\-a-z]*\d) *(?:esaeler *)?(.+)')
+# Pattern for the output of "uname -rs"
+_UNAME_PATTERN = re.compile(r'^(\S+)\s+([\d\.]+)', re.ASCII)
+
+# Separator between the lsb_release and uname output; see
+# LinuxDistribution._subprocess_cmd()
+_SUBPROCESS_SEP = '---'
+
+# Keys returned by lsb_release.get_distro_information(), mapped to the names
+# used in the output of "lsb_release -a".
+_LSB_MODULE_KEYS = {
+    'ID': 'distributor_id',
+    'DESCRIPTION': 'description',
+    'RELEASE': 'release',
+    'CODENAME': 'codename',
+}
+
+# Pattern for finding all variable assignments in an os-release file at once.
+# This allows a leading "export", as some files are written to be sourced
+# from a shell. Quoted values that span multiple lines are not supported.
+_OS_RELEASE_CONTENT_PATTERN = re.compile(
+    r'^[^\S\n]*(?:export[^\S\n]+)?([A-Za-z_][A-Za-z0-9_]*)=(.*?)[^\S\n]*$',
+    re.MULTILINE | re.ASCII)
+
+# os-release attributes that are looked up directly in the parsed file,
+# skipping the disk cache; see LinuxDistribution.os_release_attr()
+_OS_RELEASE_SCALAR_KEYS = ('id', 'name', 'version_id')
+
+# Pattern for the codename in the os-release VERSION, e.g. "7 (Core)"
+_OS_RELEASE_CODENAME_PATTERN = re.compile(
+    r'(\(\D+\))|,(\s+)?\D+', re.ASCII)
+
+# Characters that can be escaped with a backslash inside double quotes
+_OS_RELEASE_DQUOTE_ESCAPES = ('\\', '"', '$', '`')
+
+# Used to translate blanks to underscores in the lookup keys for the
+# NORMALIZED_* tables.
+_BLANK_TO_UNDERSCORE = str.maketrans(' ', '_')
+
+# Pattern for content of distro release file
+_DISTRO_RELEASE_CONTENT_PATTERN = re.compile(
+    r'^(.+?) *(?:release *)?(\d[\d.+\-a-z]*)(?: LTS)? *(?:\((.*)\)[^)]*)?$',
+    re.ASCII)
 
 # Pattern for base file name of distro release file
 _DISTRO_RELEASE_BASENAME_PATTERN = re.compile(
-    r'(\w+)[-_](release|version)$')
+    r'(\w+)[-_](release|version)$', re.ASCII)
+
+# Suffixes of base file names that may be a distro release file; these are
+# tested before matching _DISTRO_RELEASE_BASENAME_PATTERN
+_DISTRO_RELEASE_SUFFIXES = ('-release', '_release', '-version', '_version')
 
 # Base file names to be ignored when searching for distro release file
-_DISTRO_RELEASE_IGNORE_BASENAMES = (
+_DISTRO_RELEASE_IGNORE_BASENAMES = frozenset((
     'debian_version',
     'lsb-release',
     'oem-release',
     _OS_RELEASE_BASENAME,
     'system-release'
-)
+))
 
 
 def id():
     return _distro.id()
 
 
-class cached_property(object):
-    def __init__(self, f):
-        self._fname = f.__name__
-        self._f = f
+@functools.lru_cache(maxsize=64)
+def _normalize_key(distro_id):
+    return distro_id.translate(_BLANK_TO_UNDERSCORE).lower()
+
+
+def _normalize(distro_id, table):
+    """ Normalize +distro_id+ with one of the NORMALIZED_* tables. """
+    distro_id = _normalize_key(distro_id)
+    return table.get(distro_id, distro_id)
 
-    def __get__(self, obj, owner):
-        assert obj is not None, 'call {} on an instance'.format(self._fname)
-        ret = obj.__dict__[self._fname] = self._f(obj)
-        return ret
+
+@functools.lru_cache(maxsize=4)
+def _candidate_release_files(confdir_mtime):
+    """ List the possible distro release files in _UNIXCONFDIR. The mtime of
+    the directory is only used as the cache key. """
+    # We sort for repeatability in cases where there are multiple distro
+    # specific files; e.g. CentOS, Oracle, Enterprise all containing
+    # `redhat-release` on top of their own.
+    return tuple(_match_release_files(
+        sorted(entry.name for entry in os.scandir(_UNIXCONFDIR))))
+
+
+def _match_release_files(basenames):
+    """ Get a list of (basename, match) for all +basenames+ that look like a
+    distro release file. The cheap suffix test comes first, so the regexp is
+    only run for a handful of names. """
+    matches = [(b, _DISTRO_RELEASE_BASENAME_PATTERN.match(b))
+               for b in basenames
+               if b.endswith(_DISTRO_RELEASE_SUFFIXES)
+               and b not in _DISTRO_RELEASE_IGNORE_BASENAMES]
+    return [(b, m) for b, m in matches if m]
+
+
+def _mtimes(paths):
+    """ Get [path, mtime] for all +paths+; the mtime is None if the path
+    doesn't exist. """
+    mtimes = []
+    for path in paths:
+        if not path:
+            continue
+        try:
+            mtimes.append([path, os.stat(path).st_mtime_ns])
+        except OSError:
+            mtimes.append([path, None])
+    return mtimes
+
+
+def _read_disk_cache():
+    """ Read the whole disk cache: {key: {name: entry}}, where the key is
+    LinuxDistribution._cache_key.
+
+    The cache isn't used as root: writing it would leave a root-owned
+    ~/.cache in the user's HOME with sudo, and reading it would trust a file
+    the user can write. For the same reason a file that isn't ours is
+    ignored. """
+    if os.geteuid() == 0:
+        return {}
+    try:
+        with open(_CACHE_FILE) as fp:
+            if os.fstat(fp.fileno()).st_uid != os.geteuid():
+                return {}
+            cache = json.load(fp)
+    except (OSError, IOError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_disk_cache(cache):
+    if os.geteuid() == 0:
+        return
+    try:
+        os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+        tmp = '{}.{}.tmp'.format(_CACHE_FILE, os.getpid())
+        with open(tmp, 'w') as fp:
+            json.dump(cache, fp)
+        os.replace(tmp, _CACHE_FILE)
+    except (OSError, IOError):
+        # Read-only or missing HOME; just don't cache.
+        pass
+
+
+def _popen(cmd):
+    """ Start +cmd+ with stdout as a pipe; returns None if the command can't
+    be run. """
+    try:
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _lsb_release_module_info():
+    """ Get the lsb_release info from the lsb_release Python module, or None
+    if the module isn't available or get_distro_information() fails. Debian
+    and derivatives ship lsb_release as a Python script; using the module
+    directly is much faster than starting a new interpreter. """
+    try:
+        import lsb_release
+        data = lsb_release.get_distro_information()
+    except Exception:
+        return None
+    return dict((_LSB_MODULE_KEYS.get(k, k.replace(' ', '_').lower()), v)
+                for k, v in data.items())
+
+
+def _unquote_os_release_value(value):
+    """ Unquote an os-release value following the shell rules: single and
+    double quotes, backslash escapes, and stopping at the first unquoted
+    whitespace (anything after that is a comment or garbage). """
+    if not any(c in value for c in '\'"\\ \t'):
+        return value
+
+    # Most quoted values are just something like "Ubuntu 22.04.3 LTS", with
+    # nothing that needs to be unescaped.
+    quote = value[0]
+    if quote in '\'"' and len(value) > 1 and value[-1] == quote \
+       and quote not in value[1:-1] and '\\' not in value:
+        return value[1:-1]
+
+    out = []
+    quote = None
+    i = 0
+    while i < len(value):
+        c = value[i]
+        if quote == "'":
+            if c == "'":
+                quote = None
+            else:
+                out.append(c)
+        elif quote == '"':
+            if c == '"':
+                quote = None
+            elif c == '\\' and \
+                    value[i + 1:i + 2] in _OS_RELEASE_DQUOTE_ESCAPES:
+                i += 1
+                out.append(value[i])
+            else:
+                out.append(c)
+        elif c in '\'"':
+            quote = c
+        elif c == '\\':
+            i += 1
+            out.append(value[i:i + 1])
+        elif c in ' \t':
+            break
+        else:
+            out.append(c)
+        i += 1
+    return ''.join(out)
 
 
 class LinuxDistribution(object):
@@ -100,36 +298,63 @@ class LinuxDistribution(object):
                  os_release_file='',
                  distro_release_file='',
                  include_uname=True):
-        self.os_release_file = os_release_file or \
-            os.path.join(_UNIXCONFDIR, _OS_RELEASE_BASENAME)
+        if os_release_file:
+            candidates = (os_release_file,)
+        else:
+            # Some minimal images only have /usr/lib/os-release; see
+            # os-release(5).
+            candidates = (os.path.join(_UNIXCONFDIR, _OS_RELEASE_BASENAME),
+                          os.path.join(_UNIXUSRLIBDIR, _OS_RELEASE_BASENAME))
+        self.os_release_file = candidates[0]  # updated later
+        self._os_release_candidates = candidates
         self.distro_release_file = distro_release_file or ''  # updated later
         self.include_lsb = include_lsb
         self.include_uname = include_uname
+        self._proc = None
+        self._subprocess_lines = {}
+        # Instances with different arguments or directories each get their
+        # own entry in the cache file.
+        self._cache_key = json.dumps([
+            os_release_file,
+            distro_release_file,
+            self.include_lsb,
+            self.include_uname,
+            _UNIXCONFDIR,
+            _UNIXUSRLIBDIR,
+        ])
 
     def id(self):
-        def normalize(distro_id, table):
-            distro_id = distro_id.lower().replace(' ', '_')
-            return table.get(distro_id, distro_id)
-
         distro_id = self.os_release_attr('id')
         if distro_id:
-            return normalize(distro_id, NORMALIZED_OS_ID)
+            return _normalize(distro_id, NORMALIZED_OS_ID)
+
+        # Start the lsb_release and uname commands now, so they run at the
+        # same time as each other and as the distro release file scan.
+        self._prefetch()
+        try:
+            return self._fallback_id()
+        finally:
+            self._wait_prefetched()
 
+    def _fallback_id(self):
         distro_id = self.lsb_release_attr('distributor_id')
         if distro_id:
-            return normalize(distro_id, NORMALIZED_LSB_ID)
+            return _normalize(distro_id, NORMALIZED_LSB_ID)
 
         distro_id = self.distro_release_attr('id')
         if distro_id:
-            return normalize(distro_id, NORMALIZED_DISTRO_ID)
+            return _normalize(distro_id, NORMALIZED_DISTRO_ID)
 
         distro_id = self.uname_attr('id')
         if distro_id:
-            return normalize(distro_id, NORMALIZED_DISTRO_ID)
+            return _normalize(distro_id, NORMALIZED_DISTRO_ID)
 
         return ''
 
     def os_release_attr(self, attribute):
+        if attribute in _OS_RELEASE_SCALAR_KEYS \
+           and '_os_release_info' not in self.__dict__:
+            return self._os_release.get(attribute, '')
         return self._os_release_info.get(attribute, '')
 
     def lsb_release_attr(self, attribute):
@@ -141,45 +366,158 @@ class LinuxDistribution(object):
     def uname_attr(self, attribute):
         return self._uname_info.get(attribute, '')
 
+    def _prefetch(self):
+        """ Start lsb_release early if it's going to be run; uname is only
+        added to it, as it's not needed if lsb_release or the distro release
+        file gives an ID. """
+        if self._proc is None:
+            cmd = self._subprocess_cmd(('lsb_release_info', 'uname_info'))
+            if cmd is not None and 'lsb_release_info' in cmd[0]:
+                self._start_subprocess(cmd)
+
+    def _subprocess_cmd(self, names):
+        """ Get the command to run the commands for +names+ in one go,
+        leaving out anything we don't need. Returns a tuple with the names
+        that are included and the argv, or None if nothing needs to be run.
+        A single command is run directly; several are run with sh and the
+        output of each is separated by a line with _SUBPROCESS_SEP. """
+        included = []
+        cmds = []
+        for name, enabled, cmd in (
+                ('lsb_release_info', self.include_lsb, ('lsb_release', '-a')),
+                ('uname_info', self.include_uname, ('uname', '-rs'))):
+            if name not in names or not enabled \
+               or name in self._subprocess_lines \
+               or '_' + name in self.__dict__ \
+               or self._disk_cached(name) is not None \
+               or (name == 'lsb_release_info'
+                   and _lsb_release_module_info() is not None):
+                continue
+            included.append(name)
+            cmds.append(cmd)
+        if not cmds:
+            return None
+        if len(cmds) == 1:
+            return tuple(included), cmds[0]
+        sep = '; echo {}; '.format(_SUBPROCESS_SEP)
+        return tuple(included), ('sh', '-c', sep.join(' '.join(c)
+                                                      for c in cmds))
+
+    def _start_subprocess(self, cmd):
+        if cmd is not None:
+            included, cmd = cmd
+            self._proc = (included, _popen(cmd))
+
+    def _wait_prefetched(self):
+        """ Wait for the pending commands and store their output. This is also
+        called for commands started by _prefetch() that turned out not to be
+        needed, so we don't leave processes behind. """
+        pending, self._proc = self._proc, None
+        if pending is None:
+            return
+
+        names, proc = pending
+        output = [[]]
+        if proc is not None:
+            content = proc.communicate()[0]
+            for line in content.decode(
+                    sys.getfilesystemencoding()).splitlines():
+                if line == _SUBPROCESS_SEP:
+                    output.append([])
+                else:
+                    output[-1].append(line)
+        for i, name in enumerate(names):
+            self._subprocess_lines[name] = output[i] if i < len(output) else []
+
+    def _subprocess_output(self, name):
+        """ Get the output lines of the command for +name+; only that command
+        is run, unless it was already started by _prefetch(). """
+        if name not in self._subprocess_lines:
+            if self._proc is None or name not in self._proc[0]:
+                self._wait_prefetched()
+                self._start_subprocess(self._subprocess_cmd((name,)))
+            self._wait_prefetched()
+        return self._subprocess_lines.get(name, [])
+
+    @cached_property
+    def _disk_cache(self):
+        info = _read_disk_cache().get(self._cache_key)
+        return info if isinstance(info, dict) else {}
+
+    def _disk_cache_deps(self, name):
+        """ Get the files and directories that the cached +name+ is derived
+        from; the cached value is only used if none of their mtimes changed.
+        Checking /etc catches release files being added, removed, or
+        replaced (package managers write files with a rename). """
+        if name == 'os_release_info':
+            return list(self._os_release_candidates)
+        if name == 'lsb_release_info':
+            return [_UNIXCONFDIR, os.path.join(_UNIXCONFDIR, 'lsb-release')] \
+                + list(self._os_release_candidates)
+        if name == 'distro_release_info':
+            return [_UNIXCONFDIR, self.distro_release_file]
+        return []
+
+    def _disk_cached(self, name):
+        entry = self._disk_cache.get(name)
+        try:
+            if entry['deps'] != _mtimes(path for path, _ in entry['deps']):
+                return None
+        except (TypeError, KeyError, ValueError):
+            return None
+        return entry
+
+    def _from_disk_cache(self, name, compute):
+        entry = self._disk_cached(name)
+        attr = _DISK_CACHE_ATTRS.get(name)
+        if entry is not None:
+            if attr:
+                setattr(self, attr, entry[attr])
+            return entry['value']
+
+        value = compute()
+        entry = {'deps': _mtimes(self._disk_cache_deps(name)), 'value': value}
+        if attr:
+            entry[attr] = getattr(self, attr)
+        self._disk_cache[name] = entry
+        # Re-read the file so entries for other keys, possibly written by
+        # another process since we read it, are kept.
+        cache = _read_disk_cache()
+        cache[self._cache_key] = self._disk_cache
+        _write_disk_cache(cache)
+        return value
+
     @cached_property
     def _os_release_info(self):
-        if os.path.isfile(self.os_release_file):
-            with open(self.os_release_file) as release_file:
-                return self._parse_os_release_content(release_file)
+        return self._from_disk_cache(
+            'os_release_info', self._get_os_release_info)
+
+    def _get_os_release_info(self):
+        return dict(self._os_release)
+
+    @cached_property
+    def _os_release(self):
+        # The parsed file as shared between instances; don't modify it.
+        for path in self._os_release_candidates:
+            try:
+                props = _load_release_file(
+                    path, self._parse_os_release_content)
+            except OSError:
+                # Doesn't exist, is a directory, isn't readable, etc.
+                continue
+            self.os_release_file = path
+            return props
         return {}
 
     @staticmethod
-    def _parse_os_release_content(lines):
+    def _parse_os_release_content(content):
+        # The regexp finds the assignments in the entire content in one go,
+        # instead of looping over all lines in Python. Comments, blank lines,
+        # and anything that is not a variable assignment don't match.
         props = {}
-        lexer = shlex.shlex(lines, posix=True)
-        lexer.whitespace_split = True
-
-        # The shlex module defines its `wordchars` variable using literals,
-        # making it dependent on the encoding of the Python source file.
-        # In Python 2.6 and 2.7, the shlex source file is encoded in
-        # 'iso-8859-1', and the `wordchars` variable is defined as a byte
-        # string. This causes a UnicodeDecodeError to be raised when the
-        # parsed content is a unicode object. The following fix resolves that
-        # (... but it should be fixed in shlex...):
-        if sys.version_info[0] == 2 and isinstance(lexer.wordchars, bytes):
-            lexer.wordchars = lexer.wordchars.decode('iso-8859-1')
-
-        tokens = list(lexer)
-        for token in tokens:
-            # At this point, all shell-like parsing has been done (i.e.
-            # comments processed, quotes and backslash escape sequences
-            # processed, multi-line values assembled, trailing newlines
-            # stripped, etc.), so the tokens are now either:
-            # * variable assignments: var=value
-            # * commands or their arguments (not allowed in os-release)
-            if '=' in token:
-                k, v = token.split('=', 1)
-                if isinstance(v, bytes):
-                    v = v.decode('utf-8')
-                props[k.lower()] = v
-            else:
-                # Ignore any tokens that are not variable assignments
-                pass
+        for match in _OS_RELEASE_CONTENT_PATTERN.finditer(content):
+            k, v = match.groups()
+            props[k.lower()] = _unquote_os_release_value(v)
 
         if 'version_codename' in props:
             # os-release added a version_codename field.  Use that in
@@ -192,29 +530,27 @@ class LinuxDistribution(object):
             props['codename'] = props['ubuntu_codename']
         elif 'version' in props:
             # If there is no version_codename, parse it from the version
-            codename = re.search(r'(\(\D+\))|,(\s+)?\D+', props['version'])
+            codename = _OS_RELEASE_CODENAME_PATTERN.search(props['version'])
             if codename:
-                codename = codename.group()
-                codename = codename.strip('()')
-                codename = codename.strip(',')
-                codename = codename.strip()
                 # codename appears within paranthese.
-                props['codename'] = codename
+                props['codename'] = codename.group().strip('(), \t\n')
 
         return props
 
     @cached_property
     def _lsb_release_info(self):
+        return self._from_disk_cache(
+            'lsb_release_info', self._get_lsb_release_info)
+
+    def _get_lsb_release_info(self):
         if not self.include_lsb:
             return {}
-        with open(os.devnull, 'w') as devnull:
-            try:
-                cmd = ('lsb_release', '-a')
-                stdout = subprocess.check_output(cmd, stderr=devnull)
-            except OSError:  # Command not found
-                return {}
-        content = stdout.decode(sys.getfilesystemencoding()).splitlines()
-        return self._parse_lsb_release_content(content)
+
+        info = _lsb_release_module_info()
+        if info is not None:
+            return dict(info)
+        return self._parse_lsb_release_content(
+            self._subprocess_output('lsb_release_info'))
 
     @staticmethod
     def _parse_lsb_release_content(lines):
@@ -230,19 +566,19 @@ class LinuxDistribution(object):
 
     @cached_property
     def _uname_info(self):
-        with open(os.devnull, 'w') as devnull:
-            try:
-                cmd = ('uname', '-rs')
-                stdout = subprocess.check_output(cmd, stderr=devnull)
-            except OSError:
-                return {}
-        content = stdout.decode(sys.getfilesystemencoding()).splitlines()
+        # Not cached on disk, as there's no file that tells us when the
+        # kernel was upgraded.
+        if not self.include_uname:
+            return {}
+        content = self._subprocess_output('uname_info')
+        if not content:
+            return {}
         return self._parse_uname_content(content)
 
     @staticmethod
     def _parse_uname_content(lines):
         props = {}
-        match = re.search(r'^([^\s]+)\s+([\d\.]+)', lines[0].strip())
+        match = _UNAME_PATTERN.match(lines[0].strip())
         if match:
             name, version = match.groups()
 
@@ -258,6 +594,10 @@ class LinuxDistribution(object):
 
     @cached_property
     def _distro_release_info(self):
+        return self._from_disk_cache(
+            'distro_release_info', self._get_distro_release_info)
+
+    def _get_distro_release_info(self):
         if self.distro_release_file:
             # If it was specified, we use it and parse what we can, even if
             # its file name or content does not match the expected pattern.
@@ -277,11 +617,8 @@ class LinuxDistribution(object):
             return distro_info
         else:
             try:
-                basenames = os.listdir(_UNIXCONFDIR)
-                # We sort for repeatability in cases where there are multiple
-                # distro specific files; e.g. CentOS, Oracle, Enterprise all
-                # containing `redhat-release` on top of their own.
-                basenames.sort()
+                candidates = _candidate_release_files(
+                    os.stat(_UNIXCONFDIR).st_mtime_ns)
             except OSError:
                 # This may occur when /etc is not readable but we can't be
                 # sure about the *-release files. Check common entries of
@@ -302,28 +639,23 @@ class LinuxDistribution(object):
                              'redhat-release',
                              'sl-release',
                              'slackware-version']
-            for basename in basenames:
-                if basename in _DISTRO_RELEASE_IGNORE_BASENAMES:
-                    continue
-                match = _DISTRO_RELEASE_BASENAME_PATTERN.match(basename)
-                if match:
-                    filepath = os.path.join(_UNIXCONFDIR, basename)
-                    distro_info = self._parse_distro_release_file(filepath)
-                    if 'name' in distro_info:
-                        # The name is always present if the pattern matches
-                        self.distro_release_file = filepath
-                        distro_info['id'] = match.group(1)
-                        if 'cloudlinux' in distro_info['name'].lower():
-                            distro_info['id'] = 'cloudlinux'
-                        return distro_info
+                candidates = _match_release_files(basenames)
+            for basename, match in candidates:
+                filepath = os.path.join(_UNIXCONFDIR, basename)
+                distro_info = self._parse_distro_release_file(filepath)
+                if 'name' in distro_info:
+                    # The name is always present if the pattern matches
+                    self.distro_release_file = filepath
+                    distro_info['id'] = match.group(1)
+                    if 'cloudlinux' in distro_info['name'].lower():
+                        distro_info['id'] = 'cloudlinux'
+                    return distro_info
             return {}
 
     def _parse_distro_release_file(self, filepath):
         try:
-            with open(filepath) as fp:
-                # Only parse the first line. For instance, on SLES there
-                # are multiple lines. We don't want them...
-                return self._parse_distro_release_content(fp.readline())
+            return dict(_load_release_file(
+                filepath, _parse_distro_release_first_line))
         except (OSError, IOError):
             # Ignore not being able to read a specific, seemingly version
             # related file.
@@ -334,19 +666,52 @@ class LinuxDistribution(object):
     def _parse_distro_release_content(line):
         if isinstance(line, bytes):
             line = line.decode('utf-8')
-        matches = _DISTRO_RELEASE_CONTENT_REVERSED_PATTERN.match(
-            line.strip()[::-1])
+        matches = _DISTRO_RELEASE_CONTENT_PATTERN.match(line.strip())
         distro_info = {}
         if matches:
             # regexp ensures non-None
-            distro_info['name'] = matches.group(3)[::-1]
+            distro_info['name'] = matches.group(1)
             if matches.group(2):
-                distro_info['version_id'] = matches.group(2)[::-1]
-            if matches.group(1):
-                distro_info['codename'] = matches.group(1)[::-1]
+                distro_info['version_id'] = matches.group(2)
+            if matches.group(3):
+                distro_info['codename'] = matches.group(3)
         elif line:
             distro_info['name'] = line.strip()
         return distro_info
 
 
+# Parsed release files, shared between all LinuxDistribution instances, as
+# {(path, parse): (mtime, result)}. Callers should copy the result before
+# modifying it.
+_parsed_files = {}
+
+
+def _load_release_file(path, parse):
+    """ Read +path+ and parse it with +parse+, or return the earlier result if
+    the file's mtime didn't change. The file is opened only once and the mtime
+    comes from the open fd, so there is no window between checking and
+    reading it. The release files are typically well under 1K, so a single
+    read() is enough and buffered IO only adds overhead. """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        mtime = os.fstat(fd).st_mtime_ns
+        cached = _parsed_files.get((path, parse))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = os.read(fd, 8192)
+    finally:
+        os.close(fd)
+
+    result = parse(data.decode('utf-8', 'replace'))
+    _parsed_files[(path, parse)] = (mtime, result)
+    return result
+
+
+def _parse_distro_release_first_line(content):
+    # Only parse the first line. For instance, on SLES there are multiple
+    # lines. We don't want them...
+    return LinuxDistribution._parse_distro_release_content(
+        content.split('\n', 1)[0])
+
+
 _distro = LinuxDistribution()